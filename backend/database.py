@@ -2,23 +2,64 @@ from motor.motor_asyncio import AsyncIOMotorClient
 import os
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# MongoDB connection, created lazily so it binds to the event loop that is
+# running when the app starts rather than whatever exists at import time
+_client = None
 
-# MongoDB connection
-mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ.get('DB_NAME', 'shramsetu_db')]
+def get_client() -> AsyncIOMotorClient:
+    """Return the shared Motor client, creating it on first use"""
+    global _client
+    if _client is None:
+        # Load environment variables
+        load_dotenv()
+        mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+        _client = AsyncIOMotorClient(mongo_url, tz_aware=True)
+    return _client
 
-def init_db():
-    """Initialize database connection"""
+def get_db():
+    """Return the application database"""
+    return get_client()[os.environ.get('DB_NAME', 'shramsetu_db')]
+
+def close_client():
+    """Close the Motor client if it was created"""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+class LazyCollection:
+    """Collection proxy that resolves the real collection on first use"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._client = None
+        self._collection = None
+
+    def __getattr__(self, attr):
+        client = get_client()
+        if self._client is not client:
+            self._client = client
+            self._collection = get_db()[self._name]
+        return getattr(self._collection, attr)
+
+async def init_db():
+    """Verify the database connection and create indexes"""
     try:
         # Test the connection
-        client.admin.command('ping')
+        await get_db().command('ping')
         print("Connected to MongoDB successfully!")
     except Exception as e:
         print(f"Failed to connect to MongoDB: {e}")
         raise e
+    await ensure_indexes()
 
 # Collections
-laborers_collection = db.laborers
\ No newline at end of file
+laborers_collection = LazyCollection("laborers")
+jobs_collection = LazyCollection("jobs")
+
+async def ensure_indexes():
+    """Create indexes on the fields used for lookups"""
+    await laborers_collection.create_index("phone", unique=True)
+    await laborers_collection.create_index("id", unique=True)
+    await jobs_collection.create_index("job_id", unique=True)
+    await jobs_collection.create_index("skill_required")
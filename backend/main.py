@@ -1,10 +1,11 @@
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from pathlib import Path
 import os
 import logging
-from database import init_db
+from database import init_db, close_client
 from routes.register import router as register_router
 
 # Load environment variables
@@ -12,14 +13,11 @@ ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # Create the main app
-app = FastAPI(title="ShramSetu API", version="1.0.0")
+app = FastAPI(title="ShramSetu API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Initialize database
-init_db()
-
 # Include routes
 api_router.include_router(register_router, prefix="/laborers", tags=["laborers"])
 
@@ -31,11 +29,16 @@ async def root():
 # Include the router in the main app
 app.include_router(api_router)
 
-# Add CORS middleware
+# Add CORS middleware (FRONTEND_ORIGIN may list several origins, comma-separated)
+allowed_origins = [
+    origin.strip()
+    for origin in os.environ.get('FRONTEND_ORIGIN', 'http://localhost:3000').split(',')
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
+    allow_origins=allowed_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -47,7 +50,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_db_client():
+    await init_db()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    from database import client
-    client.close()
\ No newline at end of file
+    close_client()
\ No newline at end of file
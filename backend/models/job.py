@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import List, Optional
 import uuid
+from utils.helpers import get_current_timestamp
+from models.types import JobStatus, PhoneNumber
 
 class Job(BaseModel):
     job_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -11,15 +13,12 @@ class Job(BaseModel):
     location: str = Field(..., min_length=1, max_length=100)
     date: str = Field(..., min_length=1)  # Format: YYYY-MM-DD
     time: str = Field(..., min_length=1)  # Format: HH:MM
-    contact_number: str = Field(..., pattern=r'^\+?[1-9]\d{1,14}$')
-    status: str = Field(default="open", pattern=r'^(open|assigned|completed|cancelled)$')
+    contact_number: PhoneNumber
+    status: JobStatus = "open"
     assigned_laborers: List[str] = Field(default_factory=list)  # List of phone numbers
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=get_current_timestamp)
     
     class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
         json_schema_extra = {
             "example": {
                 "title": "House Construction - Mason Required",
@@ -39,7 +38,7 @@ class JobCreate(BaseModel):
     location: str = Field(..., min_length=1, max_length=100)
     date: str = Field(..., min_length=1)  # Format: YYYY-MM-DD
     time: str = Field(..., min_length=1)  # Format: HH:MM
-    contact_number: str = Field(..., pattern=r'^\+?[1-9]\d{1,14}$')
+    contact_number: PhoneNumber
     
     class Config:
         json_schema_extra = {
@@ -61,8 +60,8 @@ class JobUpdate(BaseModel):
     location: Optional[str] = Field(None, min_length=1, max_length=100)
     date: Optional[str] = Field(None, min_length=1)
     time: Optional[str] = Field(None, min_length=1)
-    contact_number: Optional[str] = Field(None, pattern=r'^\+?[1-9]\d{1,14}$')
-    status: Optional[str] = Field(None, pattern=r'^(open|assigned|completed|cancelled)$')
+    contact_number: Optional[PhoneNumber] = None
+    status: Optional[JobStatus] = None
 
 class LaborerAssignment(BaseModel):
     phone_numbers: List[str] = Field(..., min_items=1)
@@ -1,22 +1,21 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 import uuid
+from utils.helpers import get_current_timestamp
+from models.types import PhoneNumber
 
 class Laborer(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str = Field(..., min_length=1, max_length=100)
-    phone: str = Field(..., pattern=r'^\+?[1-9]\d{1,14}$')
+    phone: PhoneNumber
     skill: str = Field(..., min_length=1, max_length=50)
     location: str = Field(..., min_length=1, max_length=100)
     language: str = Field(..., min_length=1, max_length=30)
-    registered_at: datetime = Field(default_factory=datetime.utcnow)
+    registered_at: datetime = Field(default_factory=get_current_timestamp)
     available: bool = True
     
     class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
         schema_extra = {
             "example": {
                 "name": "Raju",
@@ -29,7 +28,7 @@ class Laborer(BaseModel):
 
 class LaborerCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
-    phone: str = Field(..., pattern=r'^\+?[1-9]\d{1,14}$')
+    phone: PhoneNumber
     skill: str = Field(..., min_length=1, max_length=50)
     location: str = Field(..., min_length=1, max_length=100)
     language: str = Field(..., min_length=1, max_length=30)
@@ -47,8 +46,27 @@ class LaborerCreate(BaseModel):
 
 class LaborerUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    phone: Optional[str] = Field(None, pattern=r'^\+?[1-9]\d{1,14}$')
+    phone: Optional[PhoneNumber] = None
     skill: Optional[str] = Field(None, min_length=1, max_length=50)
     location: Optional[str] = Field(None, min_length=1, max_length=100)
     language: Optional[str] = Field(None, min_length=1, max_length=30)
-    available: Optional[bool] = None
\ No newline at end of file
+    available: Optional[bool] = None
+
+class LaborerBatchCreate(BaseModel):
+    # Items are validated one by one so a bad entry fails alone instead of the whole batch
+    items: List[Dict[str, Any]] = Field(..., min_items=1, max_items=100)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {
+                        "name": "Raju",
+                        "phone": "+919876543210",
+                        "skill": "mason",
+                        "location": "Tilak Nagar",
+                        "language": "hindi"
+                    }
+                ]
+            }
+        }
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Annotated, List, Literal
+from utils.helpers import PHONE_NUMBER_PATTERN
+
+# Shared field types, declared once so every model reuses the same schema
+PhoneNumber = Annotated[str, Field(pattern=PHONE_NUMBER_PATTERN)]
+JobStatus = Literal["open", "assigned", "completed", "cancelled"]
+
+class BulkDeleteRequest(BaseModel):
+    # Capped because bulk job deletes run one atomic delete per ID concurrently
+    ids: List[str] = Field(..., min_items=1, max_items=100)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ids": ["3f2c8a9e-0b1d-4c5e-9f6a-7b8c9d0e1f2a", "8e7d6c5b-4a39-4281-9706-5f4e3d2c1b0a"]
+            }
+        }
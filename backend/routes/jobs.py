@@ -1,18 +1,16 @@
 from fastapi import APIRouter, HTTPException, status
+from pymongo import ReturnDocument
 from typing import List
+import asyncio
 from models.job import Job, JobCreate, JobUpdate, LaborerAssignment
-from database import laborers_collection
+from models.types import BulkDeleteRequest
+from database import laborers_collection, jobs_collection
+from utils.cache import cached_json_response, response_cache
 import logging
 
-# We need to add jobs collection to database.py or import it here
-from database import db
-
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Jobs collection
-jobs_collection = db.jobs
-
 @router.post("/create", response_model=Job, status_code=status.HTTP_201_CREATED)
 async def create_job(job_data: JobCreate):
     """Create a new job posting"""
@@ -24,6 +22,7 @@ async def create_job(job_data: JobCreate):
         result = await jobs_collection.insert_one(job.dict())
         
         if result.inserted_id:
+            response_cache.invalidate("jobs_all", "jobs_skill")
             logger.info(f"Job created successfully: {job.title}")
             return job
         else:
@@ -41,12 +40,14 @@ async def create_job(job_data: JobCreate):
             detail="Internal server error"
         )
 
-@router.get("/", response_model=List[Job])
+@router.get("/", responses={200: {"model": List[Job]}})
 async def get_all_jobs():
     """Get all job postings"""
     try:
-        jobs = await jobs_collection.find().to_list(1000)
-        return [Job(**job) for job in jobs]
+        return cached_json_response(
+            ("jobs_all",),
+            jobs_collection.find({}, {"_id": 0}).limit(1000)
+        )
     except Exception as e:
         logger.error(f"Error fetching jobs: {str(e)}")
         raise HTTPException(
@@ -64,7 +65,7 @@ async def get_job(job_id: str):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job not found"
             )
-        return Job(**job)
+        return Job.model_construct(**job)  # Validated when stored, so skip re-validating
     except HTTPException:
         raise
     except Exception as e:
@@ -78,24 +79,26 @@ async def get_job(job_id: str):
 async def assign_laborers_to_job(job_id: str, assignment: LaborerAssignment):
     """Assign laborers to a job by their phone numbers"""
     try:
+        # Fetch the job and all requested laborers concurrently
+        existing_job, laborers = await asyncio.gather(
+            jobs_collection.find_one({"job_id": job_id}, {"_id": 0, "assigned_laborers": 1}),
+            laborers_collection.find(
+                {"phone": {"$in": assignment.phone_numbers}},
+                {"_id": 0, "phone": 1, "available": 1}
+            ).to_list(None)
+        )
+        
         # Check if job exists
-        existing_job = await jobs_collection.find_one({"job_id": job_id})
-        if not existing_job:
+        if existing_job is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job not found"
             )
         
-        # Validate that all phone numbers correspond to existing laborers
-        valid_phone_numbers = []
-        invalid_phone_numbers = []
+        found = {laborer["phone"]: laborer for laborer in laborers}
         
-        for phone_number in assignment.phone_numbers:
-            laborer = await laborers_collection.find_one({"phone": phone_number})
-            if laborer:
-                valid_phone_numbers.append(phone_number)
-            else:
-                invalid_phone_numbers.append(phone_number)
+        # Validate that all phone numbers correspond to existing laborers
+        invalid_phone_numbers = [p for p in assignment.phone_numbers if p not in found]
         
         if invalid_phone_numbers:
             raise HTTPException(
@@ -103,12 +106,10 @@ async def assign_laborers_to_job(job_id: str, assignment: LaborerAssignment):
                 detail=f"Laborers not found for phone numbers: {invalid_phone_numbers}"
             )
         
+        valid_phone_numbers = list(dict.fromkeys(assignment.phone_numbers))
+        
         # Check if laborers are available
-        unavailable_laborers = []
-        for phone_number in valid_phone_numbers:
-            laborer = await laborers_collection.find_one({"phone": phone_number})
-            if not laborer.get("available", True):
-                unavailable_laborers.append(phone_number)
+        unavailable_laborers = [p for p in valid_phone_numbers if not found[p].get("available", True)]
         
         if unavailable_laborers:
             raise HTTPException(
@@ -126,25 +127,25 @@ async def assign_laborers_to_job(job_id: str, assignment: LaborerAssignment):
             "status": "assigned"
         }
         
-        await jobs_collection.update_one(
-            {"job_id": job_id},
-            {"$set": update_data}
-        )
-        
-        # Mark assigned laborers as unavailable
-        for phone_number in valid_phone_numbers:
-            await laborers_collection.update_one(
-                {"phone": phone_number},
+        # Save the job and mark assigned laborers as unavailable concurrently
+        updated_job, _ = await asyncio.gather(
+            jobs_collection.find_one_and_update(
+                {"job_id": job_id},
+                {"$set": update_data},
+                projection={"_id": 0},
+                return_document=ReturnDocument.AFTER
+            ),
+            laborers_collection.update_many(
+                {"phone": {"$in": valid_phone_numbers}},
                 {"$set": {"available": False}}
             )
-        
-        # Return updated job
-        updated_job = await jobs_collection.find_one({"job_id": job_id})
+        )
+        response_cache.invalidate("jobs_all", "jobs_skill", "laborers_all")
         logger.info(f"Assigned {len(valid_phone_numbers)} laborers to job {job_id}")
         
         return {
             "message": f"Successfully assigned {len(valid_phone_numbers)} laborers to job",
-            "job": Job(**updated_job),
+            "job": Job.model_construct(**updated_job),
             "assigned_laborers": valid_phone_numbers
         }
     
@@ -161,26 +162,26 @@ async def assign_laborers_to_job(job_id: str, assignment: LaborerAssignment):
 async def update_job(job_id: str, job_update: JobUpdate):
     """Update a job's information"""
     try:
-        # Check if job exists
-        existing_job = await jobs_collection.find_one({"job_id": job_id})
-        if not existing_job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job not found"
-            )
-        
         # Update only provided fields
         update_data = {k: v for k, v in job_update.dict().items() if v is not None}
         
         if update_data:
-            await jobs_collection.update_one(
+            updated_job = await jobs_collection.find_one_and_update(
                 {"job_id": job_id},
-                {"$set": update_data}
+                {"$set": update_data},
+                projection={"_id": 0},
+                return_document=ReturnDocument.AFTER
             )
+            response_cache.invalidate("jobs_all", "jobs_skill")
+        else:
+            updated_job = await jobs_collection.find_one({"job_id": job_id}, {"_id": 0})
         
-        # Return updated job
-        updated_job = await jobs_collection.find_one({"job_id": job_id})
-        return Job(**updated_job)
+        if updated_job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        return Job.model_construct(**updated_job)
     
     except HTTPException:
         raise
@@ -195,9 +196,12 @@ async def update_job(job_id: str, job_update: JobUpdate):
 async def delete_job(job_id: str):
     """Delete a job"""
     try:
-        # Get job details before deleting to free up assigned laborers
-        job = await jobs_collection.find_one({"job_id": job_id})
-        if not job:
+        # Delete the job, keeping its assigned laborers to free them up
+        job = await jobs_collection.find_one_and_delete(
+            {"job_id": job_id},
+            projection={"_id": 0, "assigned_laborers": 1}
+        )
+        if job is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job not found"
@@ -205,20 +209,13 @@ async def delete_job(job_id: str):
         
         # Free up assigned laborers (make them available again)
         assigned_laborers = job.get("assigned_laborers", [])
-        for phone_number in assigned_laborers:
-            await laborers_collection.update_one(
-                {"phone": phone_number},
+        if assigned_laborers:
+            await laborers_collection.update_many(
+                {"phone": {"$in": assigned_laborers}},
                 {"$set": {"available": True}}
             )
         
-        # Delete the job
-        result = await jobs_collection.delete_one({"job_id": job_id})
-        if result.deleted_count == 0:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job not found"
-            )
-        
+        response_cache.invalidate("jobs_all", "jobs_skill", "laborers_all")
         logger.info(f"Job deleted and {len(assigned_laborers)} laborers freed up")
         return {"message": "Job deleted successfully"}
     
@@ -231,12 +228,51 @@ async def delete_job(job_id: str):
             detail="Internal server error"
         )
 
-@router.get("/skill/{skill_name}", response_model=List[Job])
+@router.post("/bulk-delete")
+async def bulk_delete_jobs(request: BulkDeleteRequest):
+    """Delete several jobs by ID in a single request, freeing their assigned laborers"""
+    try:
+        # Delete each job atomically with the assignment list it had at deletion time,
+        # so an assignment landing mid-request can't leave laborers marked unavailable
+        deleted = await asyncio.gather(*(
+            jobs_collection.find_one_and_delete(
+                {"job_id": job_id},
+                projection={"_id": 0, "assigned_laborers": 1}
+            )
+            for job_id in set(request.ids)
+        ))
+        jobs = [job for job in deleted if job is not None]
+        
+        # Free up assigned laborers (make them available again)
+        assigned_laborers = list({phone for job in jobs for phone in job.get("assigned_laborers", [])})
+        if assigned_laborers:
+            await laborers_collection.update_many(
+                {"phone": {"$in": assigned_laborers}},
+                {"$set": {"available": True}}
+            )
+        
+        response_cache.invalidate("jobs_all", "jobs_skill", "laborers_all")
+        logger.info(f"Bulk deleted {len(jobs)} jobs and freed {len(assigned_laborers)} laborers")
+        return {
+            "message": f"Deleted {len(jobs)} jobs",
+            "deleted_count": len(jobs)
+        }
+    
+    except Exception as e:
+        logger.error(f"Error bulk deleting jobs: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+@router.get("/skill/{skill_name}", responses={200: {"model": List[Job]}})
 async def get_jobs_by_skill(skill_name: str):
     """Get all jobs requiring a specific skill"""
     try:
-        jobs = await jobs_collection.find({"skill_required": skill_name}).to_list(1000)
-        return [Job(**job) for job in jobs]
+        return cached_json_response(
+            ("jobs_skill", skill_name),
+            jobs_collection.find({"skill_required": skill_name}, {"_id": 0}).limit(1000)
+        )
     except Exception as e:
         logger.error(f"Error fetching jobs by skill: {str(e)}")
         raise HTTPException(
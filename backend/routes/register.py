@@ -1,7 +1,12 @@
 from fastapi import APIRouter, HTTPException, status
 from typing import List
-from models.laborer import Laborer, LaborerCreate, LaborerUpdate
+from pydantic import ValidationError
+from models.laborer import Laborer, LaborerBatchCreate, LaborerCreate, LaborerUpdate
+from models.types import BulkDeleteRequest
 from database import laborers_collection
+from utils.cache import cached_json_response, response_cache
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import logging
 
 router = APIRouter()
@@ -11,21 +16,20 @@ logger = logging.getLogger(__name__)
 async def register_laborer(laborer_data: LaborerCreate):
     """Register a new laborer"""
     try:
-        # Check if laborer with same phone already exists
-        existing_laborer = await laborers_collection.find_one({"phone": laborer_data.phone})
-        if existing_laborer:
+        # Create new laborer
+        laborer = Laborer(**laborer_data.dict())
+        
+        # Insert into database (the unique index on phone rejects duplicates)
+        try:
+            result = await laborers_collection.insert_one(laborer.dict())
+        except DuplicateKeyError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="A laborer with this phone number already exists"
             )
         
-        # Create new laborer
-        laborer = Laborer(**laborer_data.dict())
-        
-        # Insert into database
-        result = await laborers_collection.insert_one(laborer.dict())
-        
         if result.inserted_id:
+            response_cache.invalidate("laborers_all")
             logger.info(f"Laborer registered successfully: {laborer.name}")
             return laborer
         else:
@@ -43,12 +47,66 @@ async def register_laborer(laborer_data: LaborerCreate):
             detail="Internal server error"
         )
 
-@router.get("/", response_model=List[Laborer])
+@router.post("/register/batch")
+async def register_laborers_batch(batch: LaborerBatchCreate):
+    """Register several laborers in one request, reporting a status per item"""
+    try:
+        results = [None] * len(batch.items)
+        laborers = []
+        positions = []  # Index in batch.items of each entry in laborers
+        for index, item in enumerate(batch.items):
+            try:
+                laborer = Laborer(**LaborerCreate(**item).dict())
+            except ValidationError as e:
+                results[index] = {
+                    "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    "detail": [{"loc": error["loc"], "msg": error["msg"]} for error in e.errors()]
+                }
+                continue
+            laborers.append(laborer)
+            positions.append(index)
+
+        if laborers:
+            failed = {}
+            try:
+                # Unordered so one duplicate phone does not stop the rest of the batch
+                await laborers_collection.insert_many([laborer.dict() for laborer in laborers], ordered=False)
+            except BulkWriteError as e:
+                failed = {error["index"]: error for error in e.details.get("writeErrors", [])}
+                # Anything other than a duplicate key is a real failure
+                if any(error.get("code") != 11000 for error in failed.values()):
+                    raise
+
+            for offset, (index, laborer) in enumerate(zip(positions, laborers)):
+                if offset in failed:
+                    results[index] = {
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "detail": "A laborer with this phone number already exists"
+                    }
+                else:
+                    results[index] = {"status": status.HTTP_201_CREATED, "id": laborer.id}
+
+            if len(failed) < len(laborers):
+                response_cache.invalidate("laborers_all")
+                logger.info(f"Batch registered {len(laborers) - len(failed)} laborers")
+
+        return {"results": results}
+
+    except Exception as e:
+        logger.error(f"Error batch registering laborers: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+@router.get("/", responses={200: {"model": List[Laborer]}})
 async def get_laborers():
     """Get all registered laborers"""
     try:
-        laborers = await laborers_collection.find().to_list(1000)
-        return [Laborer(**laborer) for laborer in laborers]
+        return cached_json_response(
+            ("laborers_all",),
+            laborers_collection.find({}, {"_id": 0}).limit(1000)
+        )
     except Exception as e:
         logger.error(f"Error fetching laborers: {str(e)}")
         raise HTTPException(
@@ -66,7 +124,7 @@ async def get_laborer(laborer_id: str):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Laborer not found"
             )
-        return Laborer(**laborer)
+        return Laborer.model_construct(**laborer)
     except HTTPException:
         raise
     except Exception as e:
@@ -80,26 +138,32 @@ async def get_laborer(laborer_id: str):
 async def update_laborer(laborer_id: str, laborer_update: LaborerUpdate):
     """Update a laborer's information"""
     try:
-        # Check if laborer exists
-        existing_laborer = await laborers_collection.find_one({"id": laborer_id})
-        if not existing_laborer:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Laborer not found"
-            )
-        
         # Update only provided fields
         update_data = {k: v for k, v in laborer_update.dict().items() if v is not None}
         
         if update_data:
-            await laborers_collection.update_one(
-                {"id": laborer_id},
-                {"$set": update_data}
-            )
+            try:
+                updated_laborer = await laborers_collection.find_one_and_update(
+                    {"id": laborer_id},
+                    {"$set": update_data},
+                    projection={"_id": 0},
+                    return_document=ReturnDocument.AFTER
+                )
+            except DuplicateKeyError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="A laborer with this phone number already exists"
+                )
+            response_cache.invalidate("laborers_all")
+        else:
+            updated_laborer = await laborers_collection.find_one({"id": laborer_id}, {"_id": 0})
         
-        # Return updated laborer
-        updated_laborer = await laborers_collection.find_one({"id": laborer_id})
-        return Laborer(**updated_laborer)
+        if updated_laborer is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Laborer not found"
+            )
+        return Laborer.model_construct(**updated_laborer)
     
     except HTTPException:
         raise
@@ -120,11 +184,30 @@ async def delete_laborer(laborer_id: str):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Laborer not found"
             )
+        response_cache.invalidate("laborers_all")
         return {"message": "Laborer deleted successfully"}
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error deleting laborer: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+@router.post("/bulk-delete")
+async def bulk_delete_laborers(request: BulkDeleteRequest):
+    """Delete several laborers by ID in a single request"""
+    try:
+        result = await laborers_collection.delete_many({"id": {"$in": request.ids}})
+        response_cache.invalidate("laborers_all")
+        logger.info(f"Bulk deleted {result.deleted_count} laborers")
+        return {
+            "message": f"Deleted {result.deleted_count} laborers",
+            "deleted_count": result.deleted_count
+        }
+    except Exception as e:
+        logger.error(f"Error bulk deleting laborers: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
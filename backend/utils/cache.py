@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Hashable, List, Optional, Tuple
+
+import orjson
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+
+# How long a cached list response stays fresh, in seconds
+LIST_CACHE_TTL = 10
+# Most entries kept at once; skill names come from the URL, so keys are unbounded
+LIST_CACHE_MAX_ENTRIES = 256
+
+class TTLCache:
+    """
+    Process-local cache whose entries expire after a fixed TTL
+    Keys are tuples whose first element names the resource, so related
+    entries can be invalidated together. Once max_entries is reached the
+    oldest entry is evicted
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # Kept in insertion order, which is also expiry order since the TTL is fixed
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        # Bumped on every invalidation so in-flight fills can tell they are stale
+        self.generation = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        # Drop expired entries from the front, then the oldest ones if still full
+        while self._entries:
+            oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at >= now and len(self._entries) < self.max_entries:
+                break
+            self._entries.pop(oldest_key)
+        self._entries[key] = (now + self.ttl, value)
+
+    def invalidate(self, *names: str) -> None:
+        """Drop every entry whose key starts with one of the given names"""
+        self.generation += 1
+        for key in [key for key in self._entries if key[0] in names]:
+            self._entries.pop(key, None)
+
+response_cache = TTLCache(LIST_CACHE_TTL, LIST_CACHE_MAX_ENTRIES)
+
+def cached_json_response(key: Tuple[Hashable, ...], cursor) -> Response:
+    """
+    Serve a JSON array from the response cache, streaming the cursor on a miss
+    Documents are written out as MongoDB returns them and the encoded body
+    is cached once the stream completes, so hits skip both MongoDB and
+    serialization
+    """
+    body = response_cache.get(key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    return StreamingResponse(_stream_json_array(key, cursor), media_type="application/json")
+
+async def _stream_json_array(key: Tuple[Hashable, ...], cursor) -> AsyncIterator[bytes]:
+    generation = response_cache.generation
+    chunks: List[bytes] = [b"["]
+    yield b"["
+    async for document in cursor:
+        chunk = orjson.dumps(document, option=orjson.OPT_UTC_Z)
+        if len(chunks) > 1:
+            chunk = b"," + chunk
+        chunks.append(chunk)
+        yield chunk
+    chunks.append(b"]")
+    yield b"]"
+    # Skip caching if a write invalidated the cache while we were streaming
+    if response_cache.generation == generation:
+        response_cache.set(key, b"".join(chunks))
@@ -1,21 +1,38 @@
-from datetime import datetime
+from datetime import datetime, timezone
 import re
 from typing import Optional
 
+# Single source of the phone number format, shared with the models
+PHONE_NUMBER_PATTERN = r'^\+?[1-9]\d{1,14}$'
+
+_PHONE_RE = re.compile(PHONE_NUMBER_PATTERN)
+_NON_DIGIT_RE = re.compile(r'[^\d+]')
+
+_COMMON_SKILLS = frozenset({
+    'mason', 'carpenter', 'plumber', 'electrician', 'painter',
+    'welder', 'driver', 'helper', 'gardener', 'cleaner',
+    'cook', 'security', 'mechanic', 'tailor', 'barber'
+})
+
+_COMMON_LANGUAGES = frozenset({
+    'hindi', 'english', 'bengali', 'marathi', 'tamil',
+    'telugu', 'gujarati', 'kannada', 'malayalam', 'punjabi',
+    'oriya', 'assamese', 'urdu'
+})
+
 def validate_phone_number(phone: str) -> bool:
     """
     Validate phone number format
     Supports international format with country code
     """
-    pattern = r'^\+?[1-9]\d{1,14}$'
-    return bool(re.match(pattern, phone))
+    return bool(_PHONE_RE.match(phone))
 
 def format_phone_number(phone: str) -> str:
     """
     Format phone number to standard format
     """
     # Remove any spaces, dashes, or parentheses
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = _NON_DIGIT_RE.sub('', phone)
     
     # Add + if not present and number doesn't start with 0
     if not cleaned.startswith('+') and not cleaned.startswith('0'):
@@ -27,29 +44,19 @@ def get_current_timestamp() -> datetime:
     """
     Get current UTC timestamp
     """
-    return datetime.utcnow()
+    return datetime.now(timezone.utc)
 
 def validate_skill(skill: str) -> bool:
     """
     Validate skill name
     """
-    common_skills = [
-        'mason', 'carpenter', 'plumber', 'electrician', 'painter',
-        'welder', 'driver', 'helper', 'gardener', 'cleaner',
-        'cook', 'security', 'mechanic', 'tailor', 'barber'
-    ]
-    return skill.lower() in common_skills
+    return skill.lower() in _COMMON_SKILLS
 
 def validate_language(language: str) -> bool:
     """
     Validate language
     """
-    common_languages = [
-        'hindi', 'english', 'bengali', 'marathi', 'tamil',
-        'telugu', 'gujarati', 'kannada', 'malayalam', 'punjabi',
-        'oriya', 'assamese', 'urdu'
-    ]
-    return language.lower() in common_languages
+    return language.lower() in _COMMON_LANGUAGES
 
 def sanitize_string(input_str: str) -> str:
     """